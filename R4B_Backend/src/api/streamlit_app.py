@@ -91,7 +91,9 @@ if submit and user_input:
             wf_response = requests.post(
                 f"{os.getenv('BACKEND_URL', 'http://0.0.0.0:0000')}/jobs/query",
                 json=request_data,
-                timeout=300
+                # (connect, read): fail fast if the backend is unreachable,
+                # but leave the full budget for the workflow itself
+                timeout=(10, 300)
             )
             wf_response.raise_for_status()
             workflow_data = wf_response.json()
@@ -176,16 +178,14 @@ if workflow_data:
         
         # Create DataFrame with the structured data
         if table_data and len(table_data) > 0:
-            # Ensure each row has the correct number of columns
-            formatted_rows = []
-            for row in table_data:
-                if len(row) < len(excel_columns):
-                    # Pad with empty strings if row is too short
-                    row.extend([""] * (len(excel_columns) - len(row)))
-                elif len(row) > len(excel_columns):
-                    # Truncate if row is too long
-                    row = row[:len(excel_columns)]
-                formatted_rows.append(row)
+            # Ensure each row has the correct number of columns:
+            # truncate long rows and pad short ones with empty strings.
+            # Build new rows so the lists in session state are left untouched.
+            num_columns = len(excel_columns)
+            formatted_rows = [
+                list(row[:num_columns]) + [""] * (num_columns - len(row))
+                for row in table_data
+            ]
             
             df_excel = pd.DataFrame(formatted_rows, columns=excel_columns)
             